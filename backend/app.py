@@ -9,7 +9,7 @@ import json
 import threading
 import uuid
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 from flask import Flask, Response, jsonify, request, send_from_directory, stream_with_context
 
@@ -31,6 +31,9 @@ STATIC_DIR = FRONTEND_DIR / "static"
 
 _SESSION_STORE: Dict[str, SimulationConfig] = {}
 _SESSION_LOCK = threading.Lock()
+# Simulation payloads are plain trees of dicts, lists and scalars, so the
+# reference-cycle check is skipped and one encoder is shared by every stream.
+_SSE_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), check_circular=False)
 
 
 def create_app() -> Flask:
@@ -118,6 +121,7 @@ def _parse_simulation_config(payload: Dict[str, object]) -> SimulationConfig:
         raw_payoffs = payload.get("payoffs") or {}
         raw_chunk_size = payload.get("round_event_chunk_size")
         raw_noise_rate = payload.get("noise_rate")
+        raw_seed = payload.get("seed")
     except (TypeError, ValueError) as exc:
         raise SimulationValidationError("Invalid numeric parameters.") from exc
 
@@ -128,6 +132,7 @@ def _parse_simulation_config(payload: Dict[str, object]) -> SimulationConfig:
     payoffs = _parse_payoff_config(raw_payoffs)
     chunk_size = _parse_round_chunk_size(raw_chunk_size)
     noise_rate = _parse_noise_rate(raw_noise_rate)
+    seed = _parse_seed(raw_seed)
     return SimulationConfig(
         rounds=rounds,
         monte_carlo_runs=monte_carlo_runs,
@@ -135,6 +140,7 @@ def _parse_simulation_config(payload: Dict[str, object]) -> SimulationConfig:
         payoffs=payoffs,
         noise_rate=noise_rate,
         round_event_chunk_size=chunk_size,
+        seed=seed,
     )
 
 
@@ -211,10 +217,28 @@ def _parse_noise_rate(raw: object) -> float:
     return value
 
 
+def _parse_seed(raw: object) -> Optional[int]:
+    if raw is None:
+        return None
+    if isinstance(raw, bool):
+        raise SimulationValidationError("Invalid seed.")
+    if isinstance(raw, float):
+        # Only accept integral floats; truncating 2.7 to 2 would hide a bad seed.
+        if not raw.is_integer():
+            raise SimulationValidationError("Invalid seed.")
+        return int(raw)
+    try:
+        value = int(raw)
+    except (TypeError, ValueError) as exc:
+        raise SimulationValidationError("Invalid seed.") from exc
+    return value
+
+
 def _format_sse(event: str, payload: Dict[str, object]) -> str:
     """
     Format a payload as an SSE event block.
 
-    Each block ends with a blank line per the SSE specification.
+    Each block ends with a blank line per the SSE specification. Payloads
+    are encoded without insignificant whitespace to keep round batches small.
     """
-    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+    return f"event: {event}\ndata: {_SSE_JSON_ENCODER.encode(payload)}\n\n"
@@ -9,10 +9,12 @@ through Server-Sent Events.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Generator, List, Tuple
+from typing import Dict, Generator, Iterator, List, Optional, Sequence, Tuple
 
 import torch
 from torch import rand, randint
@@ -48,15 +50,23 @@ ALLOWED_STRATEGY_KEYS = {
 
 DEFAULT_ROUND_EVENT_CHUNK_SIZE = 64
 
+# Upper bound on rounds sampled per tensor operation in the vectorised path.
+_ROUND_BLOCK_SIZE = 4096
+# Actions are single bits (0 cooperate, 1 defect); running counts are bounded by the rounds in one run.
+_ACTION_DTYPE = torch.uint8
+_COUNT_DTYPE = torch.int32
+# `torch.Generator.manual_seed` accepts seeds below 2**64 only.
+_SEED_LIMIT = 2**64
+
 
 def resolve_strategy_type(key: str) -> StrategyType:
-    try:
-        return ALLOWED_STRATEGY_KEYS[key]
-    except KeyError as exc:  # pragma: no cover - defensive
-        raise StrategyLookupError(key) from exc
+    strategy_type = ALLOWED_STRATEGY_KEYS.get(key)
+    if strategy_type is None:
+        raise StrategyLookupError(key)
+    return strategy_type
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StrategyConfig:
     """Configuration for a single player's strategy."""
 
@@ -90,8 +100,32 @@ class StrategyConfig:
         cooperate = rand(()) < self.cooperate_probability
         return 0 if bool(cooperate.item()) else 1  # 0 => cooperate, 1 => defect
 
+    @property
+    def is_memoryless(self) -> bool:
+        """Whether actions are independent of the game history."""
+        return self.strategy_type is not StrategyType.TIT_FOR_TAT
 
-@dataclass(frozen=True)
+    def sample_actions(self, shape: Tuple[int, ...], generator: torch.Generator) -> torch.Tensor:
+        """
+        Draw a `shape`-sized tensor of independent actions in one operation.
+
+        Only valid for memoryless strategies. Returns a uint8 tensor holding
+        0 for cooperate and 1 for defect.
+        """
+        if self.strategy_type is StrategyType.ALWAYS_COOPERATE:
+            return torch.zeros(shape, dtype=_ACTION_DTYPE)
+        if self.strategy_type is StrategyType.ALWAYS_DEFECT:
+            return torch.ones(shape, dtype=_ACTION_DTYPE)
+        if self.strategy_type is StrategyType.RANDOM:
+            return randint(0, 2, shape, generator=generator, dtype=_ACTION_DTYPE)
+        if self.strategy_type is StrategyType.PROBABILISTIC:
+            return (rand(shape, generator=generator) >= self.cooperate_probability).to(_ACTION_DTYPE)
+        raise SimulationValidationError(
+            f"Strategy '{self.strategy_type.value}' depends on history and cannot be pre-sampled."
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class PayoffConfig:
     """Numerical values that define the payoff matrix."""
 
@@ -121,6 +155,7 @@ class SimulationConfig:
     payoffs: PayoffConfig = field(default_factory=PayoffConfig)
     noise_rate: float = 0.0
     round_event_chunk_size: int = DEFAULT_ROUND_EVENT_CHUNK_SIZE
+    seed: Optional[int] = None
 
     def __post_init__(self) -> None:
         if self.rounds <= 0:
@@ -131,190 +166,423 @@ class SimulationConfig:
             raise SimulationValidationError("Noise rate must be between 0 and 1.")
         if self.round_event_chunk_size <= 0:
             raise SimulationValidationError("Round event chunk size must be positive.")
+        if self.seed is not None and (
+            isinstance(self.seed, bool) or not isinstance(self.seed, int) or not 0 <= self.seed < _SEED_LIMIT
+        ):
+            raise SimulationValidationError("Seed must be an integer in [0, 2**64).")
+
+    def make_generator(self) -> torch.Generator:
+        """
+        Return a dedicated generator for one simulation.
+
+        It is seeded from `seed` when configured. Otherwise its seed is a single
+        draw from torch's global generator, so `torch.manual_seed` keeps
+        controlling reproducibility while the simulation's own draws never
+        contend for, or interleave with, other users of the global generator.
+        """
+        seed = self.seed
+        if seed is None:
+            seed = int(torch.randint(2**62, (), dtype=torch.int64).item())
+        generator = torch.Generator()
+        generator.manual_seed(seed)
+        return generator
 
 
+# Ordered so that an outcome's index is `(action_player1 << 1) | action_player2`.
 OUTCOME_KEYS = ("CC", "CD", "DC", "DD")
-OUTCOME_INDEX = {
-    (0, 0): 0,  # CC
-    (0, 1): 1,  # CD
-    (1, 0): 2,  # DC
-    (1, 1): 3,  # DD
-}
+_OUTCOME_IDS = torch.arange(len(OUTCOME_KEYS), dtype=_ACTION_DTYPE)
+# Round payload sub-dicts per outcome index; shared by every round event, so read-only.
+_ACTION_LABELS = tuple({"player1": key[0], "player2": key[1]} for key in OUTCOME_KEYS)
+_COOPERATED_FLAGS = tuple({"player1": key[0] == "C", "player2": key[1] == "C"} for key in OUTCOME_KEYS)
+
+# Per-run (payoff, cooperation count, outcome count) accumulators.
+RunTotals = Tuple[torch.Tensor, torch.Tensor, torch.Tensor]
+# Player-major `(2, 4)` payoff tensor plus the same values as `(player1, player2)` tuples, by outcome index.
+PayoffTables = Tuple[torch.Tensor, Tuple[Tuple[float, float], ...]]
+
+
+# Payoffs come from clients, so only a handful of recent sets are kept.
+@functools.lru_cache(maxsize=16)
+def _build_payoff_tables(reward: float, temptation: float, sucker: float, punishment: float) -> PayoffTables:
+    payoff_table = PayoffConfig(reward, temptation, sucker, punishment).to_tensor()
+    payoff_table = payoff_table.view(len(OUTCOME_KEYS), 2).t().contiguous()
+    return payoff_table, tuple(zip(*payoff_table.tolist()))
+
 
 def _format_tensor(values: torch.Tensor) -> Tuple[float, ...]:
     """Convert a 1D tensor into a tuple of floats."""
     return tuple(float(x) for x in values.tolist())
 
 
-def _format_counts(counts: torch.Tensor) -> Dict[str, int]:
-    """Convert outcome counts into a named dictionary."""
-    return {key: int(counts[idx].item()) for idx, key in enumerate(OUTCOME_KEYS)}
+def _format_counts(counts: Sequence[int]) -> Dict[str, int]:
+    """Convert outcome counts (as returned by `Tensor.tolist`) into a named dictionary."""
+    return {key: int(counts[idx]) for idx, key in enumerate(OUTCOME_KEYS)}
+
+
+def _round_payload(
+    run_index: int,
+    round_index: int,
+    cumulative_round: int,
+    intended_outcome: int,
+    outcome: int,
+    cooperation_totals: Sequence[float],
+    round_payoff: Sequence[float],
+    payoff_totals: Sequence[float],
+    outcome_counts: Sequence[float],
+) -> Dict[str, object]:
+    """
+    Assemble a single round event from plain Python values.
+
+    Actions arrive as outcome indices; their sub-dicts are shared constants.
+    """
+    return {
+        "run": run_index,
+        "round": round_index,
+        "cumulative_round": cumulative_round,
+        "actions": _ACTION_LABELS[outcome],
+        "intended_actions": _ACTION_LABELS[intended_outcome],
+        "cooperated": _COOPERATED_FLAGS[outcome],
+        "cumulative_cooperation": {
+            "player1": int(cooperation_totals[0]),
+            "player2": int(cooperation_totals[1]),
+        },
+        "round_payoff": {
+            "player1": float(round_payoff[0]),
+            "player2": float(round_payoff[1]),
+        },
+        "total_payoff": {
+            "player1": float(payoff_totals[0]),
+            "player2": float(payoff_totals[1]),
+        },
+        "outcome_counts": _format_counts(outcome_counts),
+    }
+
+
+def _new_run_totals(runs: int) -> RunTotals:
+    """Allocate zeroed payoff, cooperation and outcome accumulators for `runs` runs."""
+    return (
+        torch.zeros((runs, 2), dtype=torch.float32),
+        torch.zeros((runs, 2), dtype=_COUNT_DTYPE),
+        torch.zeros((runs, len(OUTCOME_KEYS)), dtype=_COUNT_DTYPE),
+    )
+
+
+def _summarise_block(
+    intended: torch.Tensor,
+    actions: torch.Tensor,
+    payoff_tables: PayoffTables,
+    totals: RunTotals,
+) -> List[Iterator[tuple]]:
+    """
+    Derive per-round statistics for a `(runs, rounds, 2)` block of actions.
+
+    `payoff_tables` come from `_build_payoff_tables`. Running totals are
+    cumulative sums seeded from `totals`, which are then advanced in place to
+    the end of the block. Every tensor is converted with a single `.tolist()`.
+    Actions are carried as packed outcome indices, and each round's payoff
+    pair is looked up from the four-entry Python table by that index rather
+    than converted per round. The result holds one iterator of round rows per
+    run, ready for `_round_payloads`.
+    """
+    run_payoff, run_cooperation_counts, run_outcome_counts = totals
+    payoff_table, payoff_lut = payoff_tables
+    outcome_idx = (actions[..., 0] << 1) | actions[..., 1]
+    # Payoffs are kept player-major, one contiguous row per player and run.
+    round_payoffs = payoff_table[:, outcome_idx.long()]
+    payoff_totals = round_payoffs.cumsum(dim=2) + run_payoff.t().unsqueeze(2)
+    cooperation_totals = (1 - actions).cumsum(dim=1, dtype=_COUNT_DTYPE) + run_cooperation_counts.unsqueeze(1)
+    outcome_totals = (outcome_idx.unsqueeze(2) == _OUTCOME_IDS).cumsum(dim=1, dtype=_COUNT_DTYPE)
+    outcome_totals += run_outcome_counts.unsqueeze(1)
+
+    run_payoff.copy_(payoff_totals[:, :, -1].t())
+    run_cooperation_counts.copy_(cooperation_totals[:, -1])
+    run_outcome_counts.copy_(outcome_totals[:, -1])
+
+    cooperation_rows = cooperation_totals.tolist()
+    outcome_idx_rows = outcome_idx.tolist()
+    if intended is actions:
+        intended_idx_rows = outcome_idx_rows
+    else:
+        intended_idx_rows = ((intended[..., 0] << 1) | intended[..., 1]).tolist()
+    payoff_total_rows = payoff_totals.tolist()
+    outcome_rows = outcome_totals.tolist()
+    return [
+        zip(
+            intended_idx_rows[run],
+            outcome_idx_rows[run],
+            cooperation_rows[run],
+            map(payoff_lut.__getitem__, outcome_idx_rows[run]),
+            zip(payoff_total_rows[0][run], payoff_total_rows[1][run]),
+            outcome_rows[run],
+        )
+        for run in range(len(outcome_idx_rows))
+    ]
+
+
+def _round_payloads(
+    run_index: int,
+    round_offset: int,
+    block_start: int,
+    rows: Iterator[tuple],
+) -> Iterator[Dict[str, object]]:
+    """Yield round payloads for one run's rows as produced by `_summarise_block`."""
+    for offset, row in enumerate(rows, start=1):
+        round_index = block_start + offset
+        yield _round_payload(run_index, round_index, round_offset + round_index, *row)
+
+
+def _mutual_tit_for_tat_actions(previous_actions: torch.Tensor, flips: torch.Tensor) -> torch.Tensor:
+    """
+    Solve a block of executed actions for two tit-for-tat players in closed form.
+
+    Each executed action is the opponent's previous executed action XOR this
+    round's noise flip. Unrolling that recurrence gives, per round, the parity
+    of a chain of flips that alternates between the players, anchored on the
+    `(runs, 2)` `previous_actions` from the end of the prior block.
+    """
+    block_rounds = flips.shape[1]
+    even_rounds = torch.arange(block_rounds) % 2 == 0
+    flips_player1, flips_player2 = flips[..., 0], flips[..., 1]
+    # Only the low bit of each running sum matters, so uint8 wraparound is harmless.
+    parity_a = torch.where(even_rounds, flips_player1, flips_player2).cumsum(dim=1, dtype=_ACTION_DTYPE) & 1
+    parity_b = torch.where(even_rounds, flips_player2, flips_player1).cumsum(dim=1, dtype=_ACTION_DTYPE) & 1
+    previous_player1 = previous_actions[:, 0:1]
+    previous_player2 = previous_actions[:, 1:2]
+    return torch.stack(
+        (
+            torch.where(even_rounds, parity_a ^ previous_player2, parity_b ^ previous_player1),
+            torch.where(even_rounds, parity_b ^ previous_player1, parity_a ^ previous_player2),
+        ),
+        dim=2,
+    )
+
+
+def _precompute_actions(
+    config: SimulationConfig,
+    runs: int,
+    block_rounds: int,
+    previous_actions: torch.Tensor,
+    generator: torch.Generator,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Draw a block of `(runs, rounds, 2)` intended and executed actions in bulk.
 
+    Memoryless players are sampled directly. A tit-for-tat player facing a
+    memoryless opponent repeats the opponent's executed action shifted by one
+    round, seeded with the `(runs, 2)` `previous_actions` from the end of the
+    prior block. When both players react, `_mutual_tit_for_tat_actions`
+    resolves the coupled recurrence, so no per-round iteration is needed.
+    """
+    noise_rate = float(config.noise_rate)
+    shape = (runs, block_rounds)
+    if not any(strategy.is_memoryless for strategy in config.player_strategies):
+        if noise_rate <= 0.0:
+            no_flips = torch.zeros((runs, block_rounds, 2), dtype=_ACTION_DTYPE)
+            actions = _mutual_tit_for_tat_actions(previous_actions, no_flips)
+            return actions, actions
+        flips = (rand((runs, block_rounds, 2), generator=generator) < noise_rate).to(_ACTION_DTYPE)
+        actions = _mutual_tit_for_tat_actions(previous_actions, flips)
+        return actions ^ flips, actions
+
+    intended = torch.empty((runs, block_rounds, 2), dtype=_ACTION_DTYPE)
+    reactive_players = []
+    for player, strategy in enumerate(config.player_strategies):
+        if strategy.is_memoryless:
+            intended[..., player] = strategy.sample_actions(shape, generator)
+        else:
+            reactive_players.append(player)
 
-def _apply_noise(action: int, noise_rate: float) -> int:
-    """Flip an intended action with probability `noise_rate` to model mis-execution."""
     if noise_rate <= 0.0:
-        return action
-    flip = rand(()) < noise_rate
-    if bool(flip.item()):
-        return 1 - action
-    return action
+        # Every intended action is executed, so one tensor serves as both.
+        for player in reactive_players:
+            opponent = 1 - player
+            intended[:, 0, player] = previous_actions[:, opponent]
+            intended[:, 1:, player] = intended[:, :-1, opponent]
+        return intended, intended
 
+    flips = (rand((runs, block_rounds, 2), generator=generator) < noise_rate).to(_ACTION_DTYPE)
+    actions = intended ^ flips
 
-def run_simulation(
+    for player in reactive_players:
+        opponent = 1 - player
+        intended[:, 0, player] = previous_actions[:, opponent]
+        intended[:, 1:, player] = actions[:, :-1, opponent]
+        actions[..., player] = intended[..., player] ^ flips[..., player]
+
+    return intended, actions
+
+
+def _play_vectorised_run(
     config: SimulationConfig,
-) -> Generator[Tuple[str, Dict[str, object]], None, None]:
+    payoff_tables: PayoffTables,
+    generator: torch.Generator,
+    run_index: int,
+    totals: RunTotals,
+) -> Iterator[Dict[str, object]]:
     """
-    Execute the simulation and yield structured events suitable for SSE.
+    Play one long run in blocks of `_ROUND_BLOCK_SIZE` rounds.
 
-    Yields:
-        Tuples of (event_name, payload_dict)
+    Working in bounded blocks keeps memory flat however many rounds are
+    requested; the last executed actions carry over between blocks.
     """
+    total_rounds = config.rounds
+    round_offset = (run_index - 1) * total_rounds
+    previous_actions = torch.zeros((1, 2), dtype=_ACTION_DTYPE)
+
+    for block_start in range(0, total_rounds, _ROUND_BLOCK_SIZE):
+        block_rounds = min(_ROUND_BLOCK_SIZE, total_rounds - block_start)
+        intended, actions = _precompute_actions(config, 1, block_rounds, previous_actions, generator)
+        previous_actions = actions[:, -1]
+        (rows,) = _summarise_block(intended, actions, payoff_tables, totals)
+        yield from _round_payloads(run_index, round_offset, block_start, rows)
 
+
+def _play_vectorised_runs(
+    config: SimulationConfig,
+    payoff_tables: PayoffTables,
+    generator: torch.Generator,
+) -> Iterator[Tuple[int, Iterator[Dict[str, object]], RunTotals]]:
+    """
+    Yield `(run_index, round_payloads, totals)` using whole-tensor operations.
+
+    Runs shorter than `_ROUND_BLOCK_SIZE` are simulated in groups that
+    together fit in one block, so many short Monte Carlo runs share a single
+    set of tensor operations; longer runs are played one at a time in bounded
+    blocks. Accumulators are allocated once and zeroed in place, so each
+    yielded `totals` is only valid until the next run is requested.
+    """
     total_rounds = config.rounds
     total_runs = config.monte_carlo_runs
-    payoff_matrix = config.payoffs.to_tensor()
-    chunk_size = config.round_event_chunk_size
-    noise_rate = float(config.noise_rate)
 
-    overall_payoff = torch.zeros(2, dtype=torch.float32)
-    overall_cooperation_counts = torch.zeros(2, dtype=torch.float32)
-    overall_outcome_counts = torch.zeros(len(OUTCOME_KEYS), dtype=torch.float32)
-
-    for run_index in range(1, total_runs + 1):
-        run_payoff = torch.zeros(2, dtype=torch.float32)
-        run_cooperation_counts = torch.zeros(2, dtype=torch.float32)
-        run_outcome_counts = torch.zeros(len(OUTCOME_KEYS), dtype=torch.float32)
-        previous_actions = (0, 0)
-        round_buffer: List[Dict[str, object]] = []
-
-        for round_index in range(1, total_rounds + 1):
-            intended_action_player1 = config.player_strategies[0].sample_action(
-                round_index=round_index,
-                opponent_previous_action=previous_actions[1],
+    if total_rounds >= _ROUND_BLOCK_SIZE:
+        totals = _new_run_totals(1)
+        for run_index in range(1, total_runs + 1):
+            for total in totals:
+                total.zero_()
+            yield (
+                run_index,
+                _play_vectorised_run(config, payoff_tables, generator, run_index, totals),
+                tuple(total[0] for total in totals),
             )
-            intended_action_player2 = config.player_strategies[1].sample_action(
-                round_index=round_index,
-                opponent_previous_action=previous_actions[0],
+        return
+
+    runs_per_group = min(_ROUND_BLOCK_SIZE // total_rounds, total_runs)
+    group_totals = _new_run_totals(runs_per_group)
+    initial_actions = torch.zeros((runs_per_group, 2), dtype=_ACTION_DTYPE)
+    for first_run in range(1, total_runs + 1, runs_per_group):
+        group_runs = min(runs_per_group, total_runs - first_run + 1)
+        totals = tuple(total[:group_runs].zero_() for total in group_totals)
+        intended, actions = _precompute_actions(
+            config,
+            group_runs,
+            total_rounds,
+            initial_actions[:group_runs],
+            generator,
+        )
+        run_rows = _summarise_block(intended, actions, payoff_tables, totals)
+        for offset, rows in enumerate(run_rows):
+            run_index = first_run + offset
+            yield (
+                run_index,
+                _round_payloads(run_index, (run_index - 1) * total_rounds, 0, rows),
+                tuple(total[offset] for total in totals),
             )
-            action_player1 = _apply_noise(intended_action_player1, noise_rate)
-            action_player2 = _apply_noise(intended_action_player2, noise_rate)
-
-            payoff = payoff_matrix[action_player1, action_player2]
-            run_payoff[0] += payoff[0]
-            run_payoff[1] += payoff[1]
-            if action_player1 == 0:
-                run_cooperation_counts[0] += 1.0
-            if action_player2 == 0:
-                run_cooperation_counts[1] += 1.0
-            outcome_idx = OUTCOME_INDEX[(action_player1, action_player2)]
-            run_outcome_counts[outcome_idx] += 1.0
-
-            cumulative_round = (run_index - 1) * total_rounds + round_index
-            cooperated_flags = (action_player1 == 0, action_player2 == 0)
-            round_payload = {
-                "run": run_index,
-                "round": round_index,
-                "cumulative_round": cumulative_round,
-                "actions": {
-                    "player1": "C" if action_player1 == 0 else "D",
-                    "player2": "C" if action_player2 == 0 else "D",
-                },
-                "intended_actions": {
-                    "player1": "C" if intended_action_player1 == 0 else "D",
-                    "player2": "C" if intended_action_player2 == 0 else "D",
-                },
-                "cooperated": {
-                    "player1": bool(cooperated_flags[0]),
-                    "player2": bool(cooperated_flags[1]),
-                },
-                "cumulative_cooperation": {
-                    "player1": int(run_cooperation_counts[0].item()),
-                    "player2": int(run_cooperation_counts[1].item()),
-                },
-                "round_payoff": {
-                    "player1": float(payoff[0].item()),
-                    "player2": float(payoff[1].item()),
-                },
-                "total_payoff": {
-                    "player1": float(run_payoff[0].item()),
-                    "player2": float(run_payoff[1].item()),
-                },
-                "cooperation_rate": {
-                    "player1": float(run_cooperation_counts[0].item() / round_index),
-                    "player2": float(run_cooperation_counts[1].item() / round_index),
-                },
-                "outcome_counts": _format_counts(run_outcome_counts),
-            }
 
-            round_buffer.append(round_payload)
-            if len(round_buffer) >= chunk_size:
-                yield ("round_batch", {"rounds": round_buffer})
-                round_buffer = []
 
-            previous_actions = (action_player1, action_player2)
+def run_simulation(
+    config: SimulationConfig,
+) -> Generator[Tuple[str, Dict[str, object]], None, None]:
+    """
+    Execute the simulation and yield structured events suitable for SSE.
 
-        overall_payoff += run_payoff
-        overall_cooperation_counts += run_cooperation_counts
-        overall_outcome_counts += run_outcome_counts
+    Yields:
+        Tuples of (event_name, payload_dict)
+    """
 
-        if round_buffer:
-            yield ("round_batch", {"rounds": round_buffer})
+    total_rounds = config.rounds
+    total_runs = config.monte_carlo_runs
+    payoffs = config.payoffs
+    payoff_tables = _build_payoff_tables(payoffs.reward, payoffs.temptation, payoffs.sucker, payoffs.punishment)
+    chunk_size = config.round_event_chunk_size
+    noise_rate = float(config.noise_rate)
+    generator = config.make_generator()
+
+    overall_payoff = [0.0, 0.0]
+    overall_cooperation_counts = [0, 0]
+    overall_outcome_counts = [0] * len(OUTCOME_KEYS)
+
+    for run_index, round_payloads, run_totals in _play_vectorised_runs(config, payoff_tables, generator):
+        # Each batch is handed to the consumer, so it is sliced into a fresh list.
+        round_batch = list(itertools.islice(round_payloads, chunk_size))
+        while round_batch:
+            yield ("round_batch", {"rounds": round_batch})
+            round_batch = list(itertools.islice(round_payloads, chunk_size))
+
+        # Each run's totals are converted once; the overall sums stay Python scalars.
+        payoff_totals, cooperation_totals, outcome_totals = (total.tolist() for total in run_totals)
+        for player in range(2):
+            overall_payoff[player] += payoff_totals[player]
+            overall_cooperation_counts[player] += cooperation_totals[player]
+        for idx, count in enumerate(outcome_totals):
+            overall_outcome_counts[idx] += count
 
         yield (
             "run_complete",
             {
                 "run": run_index,
                 "total_payoff": {
-                    "player1": float(run_payoff[0].item()),
-                    "player2": float(run_payoff[1].item()),
+                    "player1": float(payoff_totals[0]),
+                    "player2": float(payoff_totals[1]),
                 },
                 "total_cooperation": {
-                    "player1": int(run_cooperation_counts[0].item()),
-                    "player2": int(run_cooperation_counts[1].item()),
+                    "player1": int(cooperation_totals[0]),
+                    "player2": int(cooperation_totals[1]),
                 },
                 "average_payoff_per_round": {
-                    "player1": float(run_payoff[0].item() / total_rounds),
-                    "player2": float(run_payoff[1].item() / total_rounds),
+                    "player1": float(payoff_totals[0] / total_rounds),
+                    "player2": float(payoff_totals[1] / total_rounds),
                 },
                 "cooperation_rate": {
-                    "player1": float(run_cooperation_counts[0].item() / total_rounds),
-                    "player2": float(run_cooperation_counts[1].item() / total_rounds),
+                    "player1": float(cooperation_totals[0] / total_rounds),
+                    "player2": float(cooperation_totals[1] / total_rounds),
                 },
-                "outcome_counts": _format_counts(run_outcome_counts),
+                "outcome_counts": _format_counts(outcome_totals),
             },
         )
 
     total_rounds_played = float(total_rounds * total_runs)
+    payoff_totals = overall_payoff
+    cooperation_totals = overall_cooperation_counts
+    outcome_totals = overall_outcome_counts
     final_summary = {
         "runs": total_runs,
         "rounds": total_rounds,
         "total_payoff": {
-            "player1": float(overall_payoff[0].item()),
-            "player2": float(overall_payoff[1].item()),
+            "player1": float(payoff_totals[0]),
+            "player2": float(payoff_totals[1]),
         },
         "average_payoff_per_round": {
-            "player1": float(overall_payoff[0].item() / total_rounds_played),
-            "player2": float(overall_payoff[1].item() / total_rounds_played),
+            "player1": float(payoff_totals[0] / total_rounds_played),
+            "player2": float(payoff_totals[1] / total_rounds_played),
         },
         "cooperation_rate": {
-            "player1": float(overall_cooperation_counts[0].item() / total_rounds_played),
-            "player2": float(overall_cooperation_counts[1].item() / total_rounds_played),
+            "player1": float(cooperation_totals[0] / total_rounds_played),
+            "player2": float(cooperation_totals[1] / total_rounds_played),
         },
         "total_cooperation": {
-            "player1": int(overall_cooperation_counts[0].item()),
-            "player2": int(overall_cooperation_counts[1].item()),
+            "player1": int(cooperation_totals[0]),
+            "player2": int(cooperation_totals[1]),
         },
-        "outcome_counts": _format_counts(overall_outcome_counts),
+        "outcome_counts": _format_counts(outcome_totals),
         "outcome_distribution": {
-            key: float(overall_outcome_counts[idx].item() / total_rounds_played)
+            key: float(outcome_totals[idx] / total_rounds_played)
             for idx, key in enumerate(OUTCOME_KEYS)
         },
         "payoffs": {
-            "reward": float(config.payoffs.reward),
-            "temptation": float(config.payoffs.temptation),
-            "sucker": float(config.payoffs.sucker),
-            "punishment": float(config.payoffs.punishment),
+            "reward": float(payoffs.reward),
+            "temptation": float(payoffs.temptation),
+            "sucker": float(payoffs.sucker),
+            "punishment": float(payoffs.punishment),
         },
         "noise_rate": noise_rate,
         "round_event_chunk_size": chunk_size,
@@ -346,5 +614,6 @@ def serialize_config(config: SimulationConfig) -> str:
         },
         "noise_rate": config.noise_rate,
         "round_event_chunk_size": config.round_event_chunk_size,
+        "seed": config.seed,
     }
     return json.dumps(data, sort_keys=True)
@@ -308,12 +308,12 @@ function handleRoundEvent(payload) {
                 return;
             }
 
-            const cooperationRates = payload.cooperation_rate ?? {};
+            const cooperationTotals = payload.cumulative_cooperation ?? {};
             const totalCoins = totals[playerKey];
-            const cooperationRate = cooperationRates[playerKey];
+            const totalCooperation = cooperationTotals[playerKey];
             if (
                 typeof totalCoins !== "number" ||
-                typeof cooperationRate !== "number"
+                typeof totalCooperation !== "number"
             ) {
                 console.warn(`Missing totals for ${playerKey}`, payload);
                 return;
@@ -323,7 +323,7 @@ function handleRoundEvent(payload) {
             appendChartPoint(
                 playerCharts.cooperation,
                 label,
-                cooperationRate * 100
+                cooperationRateForRound(totalCooperation, payload.round) * 100
             );
 
             if (shouldUpdateChart(payload.round)) {
@@ -564,19 +564,17 @@ function createCooperationChart(context, color) {
 function updatePlayerStatsDuringRun(playerKey, payload, totalCoins) {
     const roundsPlayed = payload.round;
     const cooperationTotals = payload.cumulative_cooperation ?? {};
-    const cooperationRates = payload.cooperation_rate ?? {};
     const totalCooperation = cooperationTotals[playerKey];
-    const cooperationRate = cooperationRates[playerKey];
 
     if (
         typeof totalCoins !== "number" ||
-        typeof totalCooperation !== "number" ||
-        typeof cooperationRate !== "number"
+        typeof totalCooperation !== "number"
     ) {
         return;
     }
 
     const averagePayoff = roundsPlayed > 0 ? totalCoins / roundsPlayed : 0;
+    const cooperationRate = cooperationRateForRound(totalCooperation, roundsPlayed);
 
     setPlayerStat(playerKey, "totalCoins", totalCoins.toFixed(2));
     setPlayerStat(playerKey, "avgPayoff", averagePayoff.toFixed(3));
@@ -588,6 +586,11 @@ function updatePlayerStatsDuringRun(playerKey, payload, totalCoins) {
     setPlayerStat(playerKey, "totalCooperation", totalCooperation.toString());
 }
 
+function cooperationRateForRound(totalCooperation, roundsPlayed) {
+    // Round events carry running counts only; the rate is derived client-side.
+    return roundsPlayed > 0 ? totalCooperation / roundsPlayed : 0;
+}
+
 function resetPlayerStats() {
     PLAYER_KEYS.forEach((playerKey) => {
         ["totalCoins", "avgPayoff", "coopRate", "totalCooperation"].forEach(
@@ -0,0 +1,36 @@
+import unittest
+
+from backend.app import create_app
+
+
+class SimulationApiTests(unittest.TestCase):
+    def setUp(self):
+        self.client = create_app().test_client()
+
+    def _create(self, **overrides):
+        payload = {
+            "rounds": 3,
+            "monte_carlo_runs": 1,
+            "strategies": [{"type": "always_cooperate"}, {"type": "always_defect"}],
+        }
+        payload.update(overrides)
+        return self.client.post("/api/simulations", json=payload)
+
+    def test_valid_seed_is_accepted(self):
+        response = self._create(seed=2**64 - 1)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("simulation_id", response.get_json())
+
+    def test_out_of_range_seed_is_rejected(self):
+        for seed in (2**64, -1):
+            with self.subTest(seed=seed):
+                self.assertEqual(self._create(seed=seed).status_code, 400)
+
+    def test_non_integer_seed_is_rejected(self):
+        for seed in (2.7, True, "abc", float("nan")):
+            with self.subTest(seed=seed):
+                self.assertEqual(self._create(seed=seed).status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ from backend.simulation import (
     PayoffConfig,
     run_simulation,
 )
+from backend.simulation import _build_payoff_tables
 
 
 class SimulationConfigTests(unittest.TestCase):
@@ -53,6 +54,7 @@ class SimulationConfigTests(unittest.TestCase):
         self.assertIn("cumulative_cooperation", first_round)
         self.assertEqual(first_round["cumulative_cooperation"]["player1"], 1)
         self.assertEqual(first_round["cumulative_cooperation"]["player2"], 1)
+        self.assertNotIn("cooperation_rate", first_round)
 
         summary = next(payload for event, payload in events if event == "summary")
         self.assertAlmostEqual(summary["total_payoff"]["player1"], 9.0)
@@ -107,6 +109,23 @@ class SimulationConfigTests(unittest.TestCase):
         for round_payload in rounds[1:]:
             self.assertEqual(round_payload["actions"]["player1"], "D")
 
+    def test_sample_action_per_strategy(self):
+        cooperate = StrategyConfig(StrategyType.ALWAYS_COOPERATE)
+        defect = StrategyConfig(StrategyType.ALWAYS_DEFECT)
+        tit_for_tat = StrategyConfig(StrategyType.TIT_FOR_TAT)
+        self.assertEqual(cooperate.sample_action(round_index=2, opponent_previous_action=1), 0)
+        self.assertEqual(defect.sample_action(round_index=2, opponent_previous_action=0), 1)
+        self.assertEqual(tit_for_tat.sample_action(round_index=1, opponent_previous_action=1), 0)
+        self.assertEqual(tit_for_tat.sample_action(round_index=2, opponent_previous_action=1), 1)
+        self.assertEqual(tit_for_tat.sample_action(round_index=2, opponent_previous_action=0), 0)
+
+        never = StrategyConfig(StrategyType.PROBABILISTIC, cooperate_probability=0.0)
+        always = StrategyConfig(StrategyType.PROBABILISTIC, cooperate_probability=1.0)
+        self.assertEqual(never.sample_action(round_index=1, opponent_previous_action=0), 1)
+        self.assertEqual(always.sample_action(round_index=1, opponent_previous_action=0), 0)
+        random_action = StrategyConfig(StrategyType.RANDOM).sample_action(round_index=1, opponent_previous_action=0)
+        self.assertIn(random_action, (0, 1))
+
     def test_custom_payoff_values_are_respected(self):
         payoffs = PayoffConfig(reward=4.0, temptation=9.0, sucker=-2.0, punishment=0.5)
         config = SimulationConfig(
@@ -129,6 +148,26 @@ class SimulationConfigTests(unittest.TestCase):
         self.assertAlmostEqual(summary["payoffs"]["sucker"], payoffs.sucker)
         self.assertAlmostEqual(summary["payoffs"]["punishment"], payoffs.punishment)
 
+    def test_payoff_tensor_is_not_shared_between_calls(self):
+        payoffs = PayoffConfig()
+        first = payoffs.to_tensor()
+        first.zero_()
+        self.assertAlmostEqual(payoffs.to_tensor()[0, 0, 0].item(), payoffs.reward)
+
+    def test_payoff_table_cache_is_bounded(self):
+        for reward in range(40):
+            config = SimulationConfig(
+                rounds=1,
+                monte_carlo_runs=1,
+                player_strategies=(
+                    StrategyConfig(StrategyType.ALWAYS_COOPERATE),
+                    StrategyConfig(StrategyType.ALWAYS_COOPERATE),
+                ),
+                payoffs=PayoffConfig(reward=float(reward), temptation=50.0),
+            )
+            list(run_simulation(config))
+        self.assertLessEqual(_build_payoff_tables.cache_info().currsize, 16)
+
     def test_round_events_emitted_in_chunks(self):
         config = SimulationConfig(
             rounds=5,
@@ -184,6 +223,180 @@ class SimulationConfigTests(unittest.TestCase):
         self.assertEqual(summary["total_cooperation"]["player1"], 0)
         self.assertAlmostEqual(summary["noise_rate"], 1.0)
 
+    def test_long_memoryless_run_totals_are_consistent(self):
+        config = SimulationConfig(
+            rounds=5000,
+            monte_carlo_runs=1,
+            player_strategies=(
+                StrategyConfig(StrategyType.PROBABILISTIC, cooperate_probability=0.6),
+                StrategyConfig(StrategyType.RANDOM),
+            ),
+            noise_rate=0.1,
+        )
+
+        events = list(run_simulation(config))
+        rounds = [
+            round_payload
+            for event, payload in events
+            if event == "round_batch"
+            for round_payload in payload["rounds"]
+        ]
+        self.assertEqual([payload["round"] for payload in rounds], list(range(1, 5001)))
+        cooperations = sum(1 for payload in rounds if payload["cooperated"]["player1"])
+        self.assertEqual(rounds[-1]["cumulative_cooperation"]["player1"], cooperations)
+        self.assertEqual(sum(rounds[-1]["outcome_counts"].values()), 5000)
+
+        run_complete = next(payload for event, payload in events if event == "run_complete")
+        self.assertEqual(run_complete["total_cooperation"]["player1"], cooperations)
+        self.assertEqual(run_complete["outcome_counts"], rounds[-1]["outcome_counts"])
+        self.assertAlmostEqual(
+            run_complete["total_payoff"]["player1"],
+            sum(payload["round_payoff"]["player1"] for payload in rounds),
+            places=2,
+        )
+
+    def test_tit_for_tat_mirrors_noisy_opponent_across_blocks(self):
+        config = SimulationConfig(
+            rounds=4500,
+            monte_carlo_runs=1,
+            player_strategies=(
+                StrategyConfig(StrategyType.TIT_FOR_TAT),
+                StrategyConfig(StrategyType.PROBABILISTIC, cooperate_probability=0.5),
+            ),
+            noise_rate=0.1,
+        )
+
+        rounds = [
+            round_payload
+            for event, payload in run_simulation(config)
+            if event == "round_batch"
+            for round_payload in payload["rounds"]
+        ]
+        self.assertEqual(len(rounds), 4500)
+        self.assertEqual(rounds[0]["intended_actions"]["player1"], "C")
+        for previous, current in zip(rounds, rounds[1:]):
+            self.assertEqual(current["intended_actions"]["player1"], previous["actions"]["player2"])
+
+    def test_mutual_tit_for_tat_mirrors_noisy_actions_across_blocks(self):
+        config = SimulationConfig(
+            rounds=4500,
+            monte_carlo_runs=1,
+            player_strategies=(
+                StrategyConfig(StrategyType.TIT_FOR_TAT),
+                StrategyConfig(StrategyType.TIT_FOR_TAT),
+            ),
+            noise_rate=0.1,
+        )
+
+        rounds = [
+            round_payload
+            for event, payload in run_simulation(config)
+            if event == "round_batch"
+            for round_payload in payload["rounds"]
+        ]
+        self.assertEqual(len(rounds), 4500)
+        self.assertEqual(rounds[0]["intended_actions"], {"player1": "C", "player2": "C"})
+        for previous, current in zip(rounds, rounds[1:]):
+            self.assertEqual(current["intended_actions"]["player1"], previous["actions"]["player2"])
+            self.assertEqual(current["intended_actions"]["player2"], previous["actions"]["player1"])
+
+    def test_seeded_simulations_are_reproducible(self):
+        def collect_rounds():
+            config = SimulationConfig(
+                rounds=50,
+                monte_carlo_runs=2,
+                player_strategies=(
+                    StrategyConfig(StrategyType.PROBABILISTIC, cooperate_probability=0.4),
+                    StrategyConfig(StrategyType.TIT_FOR_TAT),
+                ),
+                noise_rate=0.1,
+                seed=1234,
+            )
+            return [payload for event, payload in run_simulation(config) if event == "round_batch"]
+
+        global_state = torch.get_rng_state()
+        first = collect_rounds()
+        torch.manual_seed(0)
+        second = collect_rounds()
+        self.assertEqual(first, second)
+        torch.set_rng_state(global_state)
+        collect_rounds()
+        self.assertTrue(torch.equal(torch.get_rng_state(), global_state))
+
+    def test_unseeded_simulations_follow_torch_manual_seed(self):
+        config = SimulationConfig(
+            rounds=20,
+            monte_carlo_runs=3,
+            player_strategies=(
+                StrategyConfig(StrategyType.RANDOM),
+                StrategyConfig(StrategyType.PROBABILISTIC, cooperate_probability=0.5),
+            ),
+            noise_rate=0.2,
+        )
+
+        torch.manual_seed(7)
+        first = list(run_simulation(config))
+        torch.manual_seed(7)
+        second = list(run_simulation(config))
+        self.assertEqual(first, second)
+
+    def test_negative_seed_raises(self):
+        with self.assertRaises(SimulationValidationError):
+            SimulationConfig(
+                rounds=3,
+                monte_carlo_runs=1,
+                player_strategies=(
+                    StrategyConfig(StrategyType.ALWAYS_COOPERATE),
+                    StrategyConfig(StrategyType.ALWAYS_COOPERATE),
+                ),
+                seed=-1,
+            )
+
+    def test_invalid_seed_values_raise(self):
+        for seed in (2**64, -1, 3.9, True):
+            with self.subTest(seed=seed), self.assertRaises(SimulationValidationError):
+                SimulationConfig(
+                    rounds=3,
+                    monte_carlo_runs=1,
+                    player_strategies=(
+                        StrategyConfig(StrategyType.ALWAYS_COOPERATE),
+                        StrategyConfig(StrategyType.ALWAYS_COOPERATE),
+                    ),
+                    seed=seed,
+                )
+
+    def test_many_short_runs_keep_independent_totals(self):
+        config = SimulationConfig(
+            rounds=3,
+            monte_carlo_runs=50,
+            player_strategies=(
+                StrategyConfig(StrategyType.ALWAYS_COOPERATE),
+                StrategyConfig(StrategyType.ALWAYS_DEFECT),
+            ),
+        )
+
+        events = list(run_simulation(config))
+        run_completes = [payload for event, payload in events if event == "run_complete"]
+        self.assertEqual([payload["run"] for payload in run_completes], list(range(1, 51)))
+        for payload in run_completes:
+            self.assertAlmostEqual(payload["total_payoff"]["player1"], 0.0)
+            self.assertAlmostEqual(payload["total_payoff"]["player2"], 15.0)
+            self.assertEqual(payload["total_cooperation"]["player1"], 3)
+            self.assertEqual(payload["outcome_counts"]["CD"], 3)
+
+        rounds = [
+            round_payload
+            for event, payload in events
+            if event == "round_batch"
+            for round_payload in payload["rounds"]
+        ]
+        self.assertEqual([payload["cumulative_round"] for payload in rounds], list(range(1, 151)))
+        self.assertTrue(all(payload["total_payoff"]["player2"] == 5.0 * payload["round"] for payload in rounds))
+
+        summary = events[-1][1]
+        self.assertAlmostEqual(summary["total_payoff"]["player2"], 750.0)
+        self.assertEqual(summary["outcome_counts"]["CD"], 150)
+
 
 if __name__ == "__main__":
     unittest.main()